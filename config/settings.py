@@ -1,27 +1,45 @@
 import configparser
 import os
+from functools import lru_cache
 
 
 # Network settings
 DEFAULT_NETWORK = "127.0.0.1", 53000, "127.0.0.1", 54000
 
-config = configparser.ConfigParser()
-if not os.path.exists('config.ini'):
-    print('config.ini not found, creating with default settings.')
-    config['NETWORK'] = {
-        'QLAB_IP': DEFAULT_NETWORK[0],
-        'QLAB_PORT': int(DEFAULT_NETWORK[1]),
-        'EOS_IP': DEFAULT_NETWORK[2],
-        'EOS_PORT': int(DEFAULT_NETWORK[3])
-    }
-    with open('config.ini', 'w') as configfile:
-        config.write(configfile)
-else:
-    # Read the existing config file
-    config.read('config.ini')
-
-QLAB_ADDRESS = config.get('NETWORK', 'QLAB_IP'), int(config.get('NETWORK', 'QLAB_PORT'))
-EOS_ADDRESS = config.get('NETWORK', 'EOS_IP'), int(config.get('NETWORK', 'EOS_PORT'))
+
+@lru_cache(maxsize=1)
+def _load_network():
+    """Read (or create) config.ini and return the NETWORK section as a plain dict.
+
+    Cached so the file is parsed exactly once no matter how many import
+    paths end up here; each config.get() call walks configparser's
+    interpolation machinery, so the section is snapshotted in one pass.
+    """
+    config = configparser.ConfigParser()
+    if not os.path.exists('config.ini'):
+        print('config.ini not found, creating with default settings.')
+        config['NETWORK'] = {
+            'QLAB_IP': DEFAULT_NETWORK[0],
+            'QLAB_PORT': int(DEFAULT_NETWORK[1]),
+            'EOS_IP': DEFAULT_NETWORK[2],
+            'EOS_PORT': int(DEFAULT_NETWORK[3])
+        }
+        with open('config.ini', 'w') as configfile:
+            config.write(configfile)
+    else:
+        # Read the existing config file
+        config.read('config.ini')
+    net = dict(config['NETWORK'])
+    # Coerce the ports to int once here rather than at every use site.
+    net['qlab_port'] = int(net['qlab_port'])
+    net['eos_port'] = int(net['eos_port'])
+    return net
+
+
+_network = _load_network()
+
+QLAB_ADDRESS = _network['qlab_ip'], _network['qlab_port']
+EOS_ADDRESS = _network['eos_ip'], _network['eos_port']
 
 # GUI defaults
 FOREGROUND = "#D9D9D7"
@@ -36,8 +54,17 @@ ORANGE = "#FF6188"
 
 # Timecode settings
 TIMECODE_FPS = 30
+FPS = TIMECODE_FPS  # Alias for modules that import the short name
 
 
 def change_fps(new_fps):
-    global TIMECODE_FPS
+    global TIMECODE_FPS, FPS
     TIMECODE_FPS = new_fps
+    FPS = new_fps
+    # cue caches its own FPS binding for hot paths; keep it in sync.
+    # Imported lazily because cue imports this module at load time.
+    import cue
+    cue.set_fps(new_fps)
+    # Formatted timecodes are memoized against the old fps; flush them.
+    import utils
+    utils.float_to_timecode.cache_clear()
@@ -1,58 +1,90 @@
 import asyncio
-from dataclasses import dataclass, field
+import sys
+from collections import OrderedDict, deque
 from typing import List, Optional, Dict, Any, Tuple
 
-from utils import timecode_to_float, float_to_timecode, parse_json
-from config.settings import TIMECODE_FPS
+import numpy as np
+
+from utils import timecode_to_float, float_to_timecode
+from config.settings import TIMECODE_FPS as _FPS
+
+
+def set_fps(new_fps):
+    """Rebind the module-cached FPS; called from config.settings.change_fps."""
+    global _FPS
+    _FPS = new_fps
 
 
-@dataclass
 class Cue:
     """Cue Class
     This class represents a cue, which has a number/id and a timecode value.
 
+    Cues are created in bulk when syncing against QLab/EOS, so the class
+    uses __slots__ and a hand-written __init__ rather than @dataclass to
+    keep per-instance cost down.
+
     Attributes:
         number (float): The cue number/id.
         timecode (float): The timecode value of the cue.
 
     Methods:
-        __post_init__():
-            Performs post-initialization tasks for the Cue object.
-
         timecode_str (property):
             Property to get the timecode in hh:mm:ss:ff format.
 
     """
-    uid: str = ''           # Cue UID
-    number: float = 0.0     # Cue number
-    timecode: Optional[float, None] = 0.0   # Timecode value
-    label: str = ""  # Cue label
+    __slots__ = ('uid', 'number', '_timecode', '_timecode_str', 'label')
+
+    def __init__(self,
+                 uid: str = '',
+                 number: float = 0.0,
+                 timecode: Optional[float] = 0.0,
+                 label: str = ""):
+        self.uid = uid              # Cue UID
+        self.number = number        # Cue number
+        self.label = label          # Cue label
+        self.timecode = timecode    # Timecode value (setter handles coercion)
 
-    def __post_init__(self):
-        """
-        Performs post-initialization tasks for the object.
+    @property
+    def timecode(self):
+        return self._timecode
+
+    @timecode.setter
+    def timecode(self, value):
+        # Coerce a timecode string to a float up front. Exact type test:
+        # the common bulk-construction path passes the 0.0 default and
+        # should fall straight through.
+        if type(value) is str:
+            if len(value) == 11:
+                value = timecode_to_float(value, _FPS)
+            else:
+                value = None
+        self._timecode = value
+        # Invalidate the cached string; recomputed lazily on next read.
+        self._timecode_str = None
 
-        :param self: The instance of the object.
-        :return: None
+    @classmethod
+    def from_timecode_str(cls, timecode_str: str, **kwargs) -> 'Cue':
+        """Build a cue from an hh:mm:ss:ff string, converting exactly once.
+
+        Callers that already hold a float should use the constructor
+        directly, which skips the conversion altogether.
         """
-        # Check if the timecode attribute is a string.
-        if isinstance(self.timecode, str):
-            # If it is, convert it to a float using the timecode_to_float function.
-            if len(self.timecode) == 11:
-                self.timecode = timecode_to_float(self.timecode)
-            else:
-                self.timecode = None
+        return cls(timecode=timecode_to_float(timecode_str, _FPS), **kwargs)
 
     @property
     def timecode_str(self):
-        """Property to get the timecode in hh:mm:ss:ff format"""
-        if self.timecode:
-            return float_to_timecode(self.timecode)
-        else:
+        """Property to get the timecode in hh:mm:ss:ff format.
+
+        The formatted string is cached so GUI redraws do not re-run
+        float_to_timecode for every access.
+        """
+        if not self._timecode:
             return None
+        if self._timecode_str is None:
+            self._timecode_str = float_to_timecode(self._timecode, _FPS)
+        return self._timecode_str
 
 
-@dataclass
 class EOSCue(Cue):
     """EOSCue Sub-class
     Represents a cue in the EOS lighting control system.
@@ -75,12 +107,20 @@ class EOSCue(Cue):
         0.5
 
     """
-    parent_cue_list: 'EOSCueList' = None    # Reference to parent cue list
-    # duration: float = 0.0   # Duration of cue
-    # follow_time: float = 0.0    # Follow/Hang duration
+    __slots__ = ('parent_cue_list',)
+
+    def __init__(self,
+                 uid: str = '',
+                 number: float = 0.0,
+                 timecode: Optional[float] = 0.0,
+                 label: str = "",
+                 parent_cue_list: 'EOSCueList' = None):
+        super().__init__(uid=uid, number=number, timecode=timecode, label=label)
+        self.parent_cue_list = parent_cue_list  # Reference to parent cue list
+        # self.duration = 0.0   # Duration of cue
+        # self.follow_time = 0.0    # Follow/Hang duration
 
 
-@dataclass
 class EOSCueList:
     """ EOSCueList Class
     Represents a cue list in the EOS lighting control system.
@@ -89,12 +129,18 @@ class EOSCueList:
         number (int): The number of the cue list.
         cue_list_dict (Dict['EOSCue']): The list of cues in the cue list.
     """
-    uid: str = ''   # Cue list unique ID
-    number: int = 1     # Cue list number
-    cue_list_dict: Dict[str: 'EOSCue'] = field(default_factory=dict)  # Contains cues in the cue list
+    __slots__ = ('uid', 'number', 'cue_list_dict')
+
+    def __init__(self,
+                 uid: str = '',
+                 number: int = 1,
+                 cue_list_dict: Optional[Dict[str, 'EOSCue']] = None):
+        self.uid = uid          # Cue list unique ID
+        self.number = number    # Cue list number
+        # Contains cues in the cue list
+        self.cue_list_dict = cue_list_dict if cue_list_dict is not None else {}
 
 
-@dataclass
 class QLabCue(Cue):
     """QLabCue Sub-class
     Represents a cue in the QLab system. It provides properties and
@@ -103,7 +149,7 @@ class QLabCue(Cue):
 
     Attributes:
         type (str): The type of the cue.
-        cue_list (List[QLabCue]): A list of child cues, if available.
+        cue_dict (Dict[str, QLabCue]): A dict of child cues, if available.
         parent_cue (Optional[QLabCue]): A reference to the parent cue, if any.
         duration (float): The duration of the cue.
         pre_wait_time (float): The pre-wait time before the cue starts.
@@ -117,34 +163,147 @@ class QLabCue(Cue):
 
         >>> child_cue1 = QLabCue(type="Light")
         >>> child_cue2 = QLabCue(type="Video")
-        >>> cue.cue_list = [child_cue1, child_cue2]
+        >>> cue.cue_dict = {child_cue1.uid: child_cue1, child_cue2.uid: child_cue2}
 
         >>> cue.parent_cue = None
         >>> cue.pre_wait_time = 2.0
         >>> cue.post_wait_time = 1.0
 
-    Note:
-        This class does not provide specific implementation details, but serves as a blueprint for creating and
-        managing cues in the QLab system.
-
     """
-    type: str = ""  # Cue type
-    cue_dict: Dict[str: 'QLabCue'] = field(default_factory=dict)     # Contains child cues, if a list
-    parent_cue: Optional['QLabCue'] = None  # Reference to parent cue, if any
-    duration: float = 0.0   # Duration of cue
-    pre_wait_time: float = 0.0      # Pre-wait time
-    post_wait_time: float = 0.0     # Post-wait time
-    file_target_path: Optional[str] = None  # File target path
-    target_id: Optional[str] = None     # Target cue ID
-
-    def __post_init__(self):
-        super().__post_init__()
-        if isinstance(self.duration, str):
-            self.duration = float(self.duration)
-        if isinstance(self.pre_wait_time, str):
-            self.pre_wait_time = float(self.duration)
-        if isinstance(self.post_wait_time, str):
-            self.post_wait_time = float(self.duration)
+    __slots__ = ('type', 'cue_dict', 'parent_cue', 'duration',
+                 'pre_wait_time', 'post_wait_time', 'file_target_path', 'target_id',
+                 '_addr_prefix', '_reply_prefix',
+                 'first_child', 'last_child', 'prev_sibling', 'next_sibling')
+
+    def __init__(self,
+                 uid: str = '',
+                 number: float = 0.0,
+                 timecode: Optional[float] = 0.0,
+                 label: str = "",
+                 type: str = "",
+                 cue_dict: Optional[Dict[str, 'QLabCue']] = None,
+                 parent_cue: Optional['QLabCue'] = None,
+                 duration: float = 0.0,
+                 pre_wait_time: float = 0.0,
+                 post_wait_time: float = 0.0,
+                 file_target_path: Optional[str] = None,
+                 target_id: Optional[str] = None):
+        super().__init__(uid=uid, number=number, timecode=timecode, label=label)
+        self.type = type    # Cue type
+        self.cue_dict = cue_dict if cue_dict is not None else {}    # Contains child cues, if a list
+        self.parent_cue = parent_cue    # Reference to parent cue, if any
+        # Coerce each time field from its own value (the old per-field
+        # checks all read duration). isinstance here, not type(): the
+        # `type` parameter shadows the builtin in this scope.
+        if isinstance(duration, str):
+            duration = float(duration)
+        if isinstance(pre_wait_time, str):
+            pre_wait_time = float(pre_wait_time)
+        if isinstance(post_wait_time, str):
+            post_wait_time = float(post_wait_time)
+        self.duration = duration    # Duration of cue
+        self.pre_wait_time = pre_wait_time      # Pre-wait time
+        self.post_wait_time = post_wait_time    # Post-wait time
+        self.file_target_path = file_target_path    # File target path
+        self.target_id = target_id      # Target cue ID
+        # OSC address prefixes are invariant per cue; build them once.
+        self._addr_prefix = '/cue_id/' + uid
+        self._reply_prefix = '/reply/cue_id/' + uid
+        # Intrusive sibling chain for ordered, cache-friendly traversal;
+        # cue_dict stays for uid-keyed lookup.
+        self.first_child = None
+        self.last_child = None
+        self.prev_sibling = None
+        self.next_sibling = None
+
+    def append_child(self, child: 'QLabCue'):
+        """Link child onto the end of the sibling chain in O(1).
+
+        Re-appending a cue already in this chain would self-link it and
+        make iter_children loop forever, so a linked child is unlinked
+        first — repeat adds stay idempotent, as the dict insert always was.
+        """
+        if child.parent_cue is self and (
+                child is self.first_child or child.prev_sibling is not None):
+            if child is self.last_child:
+                return
+            self.unlink_child(child)
+        child.prev_sibling = self.last_child
+        child.next_sibling = None
+        if self.last_child is not None:
+            self.last_child.next_sibling = child
+        else:
+            self.first_child = child
+        self.last_child = child
+
+    def unlink_child(self, child: 'QLabCue'):
+        """Detach child from the sibling chain by patching two pointers."""
+        if child.prev_sibling is not None:
+            child.prev_sibling.next_sibling = child.next_sibling
+        else:
+            self.first_child = child.next_sibling
+        if child.next_sibling is not None:
+            child.next_sibling.prev_sibling = child.prev_sibling
+        else:
+            self.last_child = child.prev_sibling
+        child.prev_sibling = None
+        child.next_sibling = None
+
+    def iter_children(self):
+        """Yield child cues in insertion order via the sibling chain."""
+        node = self.first_child
+        while node is not None:
+            yield node
+            node = node.next_sibling
+
+    @classmethod
+    def _unchecked(cls, uid: str, number: float, parent_cue: Optional['QLabCue'],
+                   type: str, label: str) -> 'QLabCue':
+        """Fast-path factory for bulk construction from already-parsed QLab replies.
+
+        Bypasses __init__ and its string coercion entirely; only valid for
+        internal call sites where the inputs are known to be clean.
+        """
+        obj = object.__new__(cls)
+        obj.uid = uid
+        obj.number = number
+        obj._timecode = 0.0
+        obj._timecode_str = None
+        obj.label = label
+        obj.type = type
+        obj.cue_dict = {}
+        obj.parent_cue = parent_cue
+        obj.duration = 0.0
+        obj.pre_wait_time = 0.0
+        obj.post_wait_time = 0.0
+        obj.file_target_path = None
+        obj.target_id = None
+        obj._addr_prefix = '/cue_id/' + uid
+        obj._reply_prefix = '/reply/cue_id/' + uid
+        obj.first_child = None
+        obj.last_child = None
+        obj.prev_sibling = None
+        obj.next_sibling = None
+        return obj
+
+
+# Dispatch table mapping QLab attribute query suffixes to the cue fields
+# they populate, replacing per-response string-compare chains.
+_SETTERS = {
+    '/duration': 'duration',
+    '/preWait': 'pre_wait_time',
+    '/postWait': 'post_wait_time',
+    '/timecodeTrigger/text': 'timecode',
+}
+
+# Bound on the per-cue attribute cache so memory stays flat under churn.
+_ATTR_CACHE_MAX = 4096
+
+# Query suffixes fetched per cue; module-level tuples so the hot fetch path
+# never rebuilds them.
+_ATTRIBUTE_SUFFIXES = ("/duration", "/preWait", "/postWait", "/timecodeTrigger/text")
+_TARGET_SUFFIXES = ("/hasFileTargets", "/hasCueTargets")
+_EXTRA_SUFFIXES = _TARGET_SUFFIXES + _ATTRIBUTE_SUFFIXES
 
 
 class CueManager:
@@ -177,8 +336,8 @@ class CueManager:
             Parameters:
                 cue_id (str): The ID of the QLab cue to remove.
 
-        solve_nested_qlab_cues(parent_cue, cue_data)
-            Solves the nested QLab cues and adds them to the cue manager.
+        _build_nested_qlab_cues(parent_cue, cue_data)
+            Builds the nested QLab cues and adds them to the cue manager.
 
             Parameters:
                 parent_cue (QLabCue): The parent cue to add the nested cues to.
@@ -215,6 +374,10 @@ class CueManager:
                 query (str): The OSC query message.
                 response (str): The OSC response address.
     """
+    __slots__ = ('loop', 'osc_handler', 'qlab_cues', 'eos_cues', '_query_semaphore',
+                 '_attr_cache', '_qlab_cuelists_hash',
+                 '_cue_index', '_duration', '_pre_wait', '_post_wait', '_timecode')
+
     def __init__(self, loop, osc_handler):
         self.loop = loop
         self.osc_handler = osc_handler
@@ -222,148 +385,288 @@ class CueManager:
         self.qlab_cues = {}
         self.eos_cues = {}
 
+        # Cap on concurrently in-flight OSC queries so batched dispatch
+        # does not overwhelm QLab/EOS.
+        self._query_semaphore = asyncio.Semaphore(32)
+
+        # LRU cache of fetched extra data keyed by cue uid, stamped with
+        # the workspace revision it was fetched under.
+        self._attr_cache: OrderedDict[str, Tuple[Any, Dict[str, Any]]] = OrderedDict()
+
+        # Fingerprint of the last /cueLists reply so an unchanged tree is
+        # not torn down and rebuilt on every refresh.
+        self._qlab_cuelists_hash: Optional[int] = None
+
+        # SoA mirror of the numeric cue fields: timeline passes that scan
+        # every cue (scrubbing, serialization) read these dense arrays in
+        # one vectorized sweep instead of chasing per-object pointers.
+        # The Cue objects stay authoritative for metadata.
+        self._cue_index: Dict[str, int] = {}
+        self._duration = np.zeros(0, dtype=np.float64)
+        self._pre_wait = np.zeros(0, dtype=np.float64)
+        self._post_wait = np.zeros(0, dtype=np.float64)
+        self._timecode = np.zeros(0, dtype=np.float64)
+
     async def initialise(self):
-        self.loop.create_task(self.populate_qlab_cue_dict())
-        self.loop.create_task(self.populate_eos_cue_dict())
+        # Eager tasks (3.12+) let coroutines that can finish without
+        # suspending skip the event-loop round-trip that lazy task
+        # scheduling pays; older runtimes keep the default factory.
+        if hasattr(asyncio, 'eager_task_factory'):
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+        asyncio.create_task(self.populate_qlab_cue_dict())
+        asyncio.create_task(self.populate_eos_cue_dict())
 
     # QLAB
-    async def add_qlab_cue(self, new_cue: QLabCue, parent_cue_id: Optional[str] = None):
+    def add_qlab_cue(self, new_cue: QLabCue, parent_cue_id: Optional[str] = None):
+        """Bare insert for trusted internal callers; the parent is assumed to exist."""
+        if parent_cue_id:
+            parent_cue = self.qlab_cues[parent_cue_id]
+            parent_cue.cue_dict[new_cue.uid] = new_cue
+            parent_cue.append_child(new_cue)
+            new_cue.parent_cue = parent_cue
+        self.qlab_cues[new_cue.uid] = new_cue
+        self._mirror_numeric_fields(new_cue)
+
+    def add_qlab_cue_checked(self, new_cue: QLabCue, parent_cue_id: Optional[str] = None):
+        """Validating insert for external callers; raises if the parent is missing."""
         if parent_cue_id:
             parent_cue = self.qlab_cues.get(parent_cue_id)
             if parent_cue:
                 parent_cue.cue_dict[new_cue.uid] = new_cue
+                parent_cue.append_child(new_cue)
                 if new_cue.parent_cue != parent_cue:
                     new_cue.parent_cue = parent_cue
             else:
                 raise ValueError(f"Parent QLabCue with ID {parent_cue_id} not found.")
         self.qlab_cues[new_cue.uid] = new_cue
+        self._mirror_numeric_fields(new_cue)
 
-    async def remove_qlab_cue(self, cue_id: str):
+    def remove_qlab_cue(self, cue_id: str):
         cue = self.qlab_cues.pop(cue_id, None)
         if cue:
             if cue.parent_cue:
+                cue.parent_cue.unlink_child(cue)
                 del cue.parent_cue.cue_dict[cue_id]
             cue.parent_cue = None
         else:
             raise ValueError(f"QLabCue with ID {cue_id} not found.")
 
-    async def solve_nested_qlab_cues(self, parent_cue: QLabCue, cue_data: List[Dict[str, Any]]):
-        for c in cue_data:
-            qlab_cue = QLabCue(
-                uid=c['uniqueID'],
-                number=c['number'],
-                parent_cue=parent_cue,
-                type=c['type'],
-                label=c['name']
-            )
-            parent_cue.cue_dict[qlab_cue.uid] = qlab_cue
-            self.qlab_cues[qlab_cue.uid] = qlab_cue
+    def _build_nested_qlab_cues(self, parent_cue: QLabCue, cue_data: List[Dict[str, Any]]):
+        # Pure dict construction with no I/O, so walk the tree with an
+        # explicit stack rather than paying a coroutine frame per level.
+        stack = deque([(parent_cue, cue_data)])
+        while stack:
+            parent, data = stack.pop()
+            for c in data:
+                qlab_cue = QLabCue._unchecked(
+                    uid=c['uniqueID'],
+                    number=c['number'],
+                    parent_cue=parent,
+                    type=c['type'],
+                    label=c['name']
+                )
+                # Interned keys let dict lookups hit the identity fast path.
+                uid = sys.intern(qlab_cue.uid)
+                parent.cue_dict[uid] = qlab_cue
+                parent.append_child(qlab_cue)
+                self.qlab_cues[uid] = qlab_cue
+                self._mirror_numeric_fields(qlab_cue)
 
-            if 'cues' in c and len(c['cues']) > 0:
-                await self.solve_nested_qlab_cues(qlab_cue, c['cues'])
+                if c.get('cues'):
+                    stack.append((qlab_cue, c['cues']))
 
     async def add_extra_qlab_data(self):
-        attribute_query_list = ["/duration", "/preWait", "/postWait", "/timecodeTrigger/text"]
-
-        # Iterate over all cues generated.
-        for cue_id, cue in self.qlab_cues.items():
-
-            # Handle file target path acquisition
-            address, response_json = await self.query(
-                client=self.osc_handler.qlab_client,
-                dispatcher=self.osc_handler.qlab_dispatcher,
-                query=f'/cue_id/{cue_id}/hasFileTargets',
-                response=f'/reply/cue_id/{cue_id}/hasFileTargets'
-            )
-            response = parse_json(response_json)
-            if response['data']:    # If hasFileTargets is True, then query the file target and record.
-                address, response_json = await self.query(
-                    client=self.osc_handler.qlab_client,
-                    dispatcher=self.osc_handler.qlab_dispatcher,
-                    query=f'/cue_id/{cue_id}/fileTarget',
-                    response=f'/reply/cue_id/{cue_id}/fileTarget'
-                )
-                response = parse_json(response_json)
-                cue.file_target_path = response['data']
-
-            # Handle cue target path acquisition
-            address, response_json = await self.query(
+        # One revision probe per refresh lets cues whose data was fetched
+        # under the same revision be served from the cache with no I/O.
+        revision = await self._query_workspace_revision()
+        # Every cue's fetch is independent, so run them all concurrently;
+        # the query semaphore bounds how many are actually in flight.
+        await asyncio.gather(*[
+            self._fetch_extra(cue_id, cue, revision)
+            for cue_id, cue in self.qlab_cues.items()
+        ])
+
+    async def _query_workspace_revision(self) -> Optional[Any]:
+        workspace_uid = self.osc_handler.qlab_workspace_uid
+        if not workspace_uid:
+            return None
+        result = await self.query(
+            client=self.osc_handler.qlab_client,
+            dispatcher=self.osc_handler.qlab_dispatcher,
+            query=f'/workspace/{workspace_uid}/revisionNumber',
+            response=f'/reply/workspace/{workspace_uid}/revisionNumber',
+            json_reply=True
+        )
+        if result is None:
+            return None
+        address, response = result
+        if response and response['status'] == 'ok':
+            return response['data']
+        return None
+
+    async def _fetch_extra(self, cue_id: str, cue: QLabCue, revision: Optional[Any] = None):
+        # Serve the whole record from cache when it was fetched under the
+        # current workspace revision.
+        if revision is not None:
+            cached = self._attr_cache.get(cue_id)
+            if cached is not None and cached[0] == revision:
+                self._attr_cache.move_to_end(cue_id)
+                self._apply_extra(cue, cached[1])
+                return
+
+        # The invariant address prefixes were precomputed on the cue.
+        query_prefix = cue._addr_prefix
+        reply_prefix = cue._reply_prefix
+
+        # One bundle of queries per cue rather than six serial round-trips.
+        results = await self.query_bundle(
+            client=self.osc_handler.qlab_client,
+            dispatcher=self.osc_handler.qlab_dispatcher,
+            pairs=[(query_prefix + s, reply_prefix + s) for s in _EXTRA_SUFFIXES],
+            json_reply=True
+        )
+        if results is None:
+            return
+        responses = {
+            suffix: response
+            for suffix, (address, response) in zip(_EXTRA_SUFFIXES, results)
+        }
+
+        record = {attribute: responses[attribute]['data'] for attribute in _ATTRIBUTE_SUFFIXES}
+        record['/fileTarget'] = None
+        record['/cueTargetID'] = None
+
+        # Follow-up bundle only for the targets the cue reported having.
+        follow_ups = []
+        if responses['/hasFileTargets']['data']:
+            follow_ups.append('/fileTarget')
+        if responses['/hasCueTargets']['data']:
+            follow_ups.append('/cueTargetID')
+        if follow_ups:
+            results = await self.query_bundle(
                 client=self.osc_handler.qlab_client,
                 dispatcher=self.osc_handler.qlab_dispatcher,
-                query=f'/cue_id/{cue_id}/hasCueTargets',
-                response=f'/reply/cue_id/{cue_id}/hasCueTargets'
+                pairs=[(query_prefix + s, reply_prefix + s) for s in follow_ups],
+                json_reply=True
             )
-            response = parse_json(response_json)
-            if response['data']:  # If hasCueTargets is True, then query the cue target id and record.
-                address, response_json = await self.query(
-                    client=self.osc_handler.qlab_client,
-                    dispatcher=self.osc_handler.qlab_dispatcher,
-                    query=f'/cue_id/{cue_id}/cueTargetID',
-                    response=f'/reply/cue_id/{cue_id}/cueTargetID'
-                )
-                response = parse_json(response_json)
-                cue.target_id = response['data']
-
-            # Handle all other attributes
-            for attribute in attribute_query_list:
-                query_address = f"/cue_id/{cue_id}{attribute}"
-                response_address = f"/reply/cue_id/{cue_id}{attribute}"
-                address, response_json = await self.query(
-                    client=self.osc_handler.qlab_client,
-                    dispatcher=self.osc_handler.qlab_dispatcher,
-                    query=query_address,
-                    response=response_address
-                )
-                response = parse_json(response_json)
-                if attribute == '/duration':
-                    cue.duration = response['data']
-                elif attribute == '/preWait':
-                    cue.pre_wait_time = response['data']
-                elif attribute == '/postWait':
-                    cue.pre_wait_time = response['data']
-                elif attribute == '/timecodeTrigger/text':
-                    cue.timecode = response['data']
+            if results is not None:
+                for suffix, (address, response) in zip(follow_ups, results):
+                    record[suffix] = response['data']
+
+        self._apply_extra(cue, record)
+        if revision is not None:
+            self._attr_cache[cue_id] = (revision, record)
+            self._attr_cache.move_to_end(cue_id)
+            if len(self._attr_cache) > _ATTR_CACHE_MAX:
+                self._attr_cache.popitem(last=False)
+
+    def _apply_extra(self, cue: QLabCue, record: Dict[str, Any]):
+        if record['/fileTarget'] is not None:
+            cue.file_target_path = record['/fileTarget']
+        if record['/cueTargetID'] is not None:
+            cue.target_id = record['/cueTargetID']
+        for attribute, field in _SETTERS.items():
+            setattr(cue, field, record[attribute])
+        self._mirror_numeric_fields(cue)
+
+    def _mirror_numeric_fields(self, cue: QLabCue):
+        """Copy the cue's numeric fields into its SoA slot, assigning one if needed.
+
+        Called on every insert as well as after attribute fetches, so the
+        vectorized scans see all cues — including ones whose extra-data
+        fetch failed or never ran.
+        """
+        slot = self._assign_slot(cue.uid)
+        self._duration[slot] = cue.duration or 0.0
+        self._pre_wait[slot] = cue.pre_wait_time or 0.0
+        self._post_wait[slot] = cue.post_wait_time or 0.0
+        self._timecode[slot] = cue.timecode or 0.0
+
+    def _assign_slot(self, cue_id: str) -> int:
+        """Return the cue's slot in the SoA arrays, growing them amortized."""
+        slot = self._cue_index.get(cue_id)
+        if slot is None:
+            slot = len(self._cue_index)
+            self._cue_index[cue_id] = slot
+            if slot >= self._duration.shape[0]:
+                new_size = max(64, 2 * self._duration.shape[0])
+                for name in ('_duration', '_pre_wait', '_post_wait', '_timecode'):
+                    old = getattr(self, name)
+                    grown = np.zeros(new_size, dtype=np.float64)
+                    grown[:old.shape[0]] = old
+                    setattr(self, name, grown)
+        return slot
+
+    def qlab_cues_with_timecode_before(self, t: float) -> List[QLabCue]:
+        """Return QLab cues whose timecode precedes t, via one vectorized scan."""
+        count = len(self._cue_index)
+        mask = self._timecode[:count] < t
+        return [
+            self.qlab_cues[cue_id]
+            for cue_id, slot in self._cue_index.items()
+            if mask[slot] and cue_id in self.qlab_cues
+        ]
 
     async def populate_qlab_cue_dict(self):
-        self.qlab_cues.clear()
-        address, response_json = await self.query(
+        address, response = await self.query(
             client=self.osc_handler.qlab_client,
             dispatcher=self.osc_handler.qlab_dispatcher,
-            query='/cueLists', response='/reply/cueLists'
+            query='/cueLists', response='/reply/cueLists',
+            json_reply=True
         )
-        response = parse_json(response_json)
         if response and response['status'] == 'ok':
+            # If the cue tree itself is unchanged, keep the existing Cue
+            # objects and only refresh attributes — the revision-stamped
+            # cache in _fetch_extra then limits that to real changes.
+            data_hash = hash(repr(response['data']))
+            if data_hash == self._qlab_cuelists_hash and self.qlab_cues:
+                await self.add_extra_qlab_data()
+                return
+            self._qlab_cuelists_hash = data_hash
+            self.qlab_cues.clear()
+            # Slots are handed out from scratch for the rebuilt tree.
+            self._cue_index.clear()
             for cue_list_data in response['data']:
-                root_cue = QLabCue(
+                root_cue = QLabCue._unchecked(
                     uid=cue_list_data['uniqueID'],
                     number=cue_list_data['number'],
                     parent_cue=None,
                     type=cue_list_data['type'],
                     label=cue_list_data['name']
                 )
-                self.qlab_cues[root_cue.uid] = root_cue
-                if 'cues' in cue_list_data and cue_list_data['cues']:
-                    await self.solve_nested_qlab_cues(root_cue, cue_list_data['cues'])
+                self.qlab_cues[sys.intern(root_cue.uid)] = root_cue
+                self._mirror_numeric_fields(root_cue)
+                if cue_list_data.get('cues'):
+                    self._build_nested_qlab_cues(root_cue, cue_list_data['cues'])
             await self.add_extra_qlab_data()
 
     # EOS
-    async def add_eos_cue(self, new_cue: QLabCue, parent_cue_id: Optional[str] = None):
+    def add_eos_cue(self, new_cue: EOSCue, parent_cue_id: Optional[str] = None):
+        """Bare insert for trusted internal callers; the parent list is assumed to exist."""
+        if parent_cue_id:
+            parent_cue_list = self.eos_cues[parent_cue_id]
+            parent_cue_list.cue_list_dict[new_cue.uid] = new_cue
+            new_cue.parent_cue_list = parent_cue_list
+        self.eos_cues[new_cue.uid] = new_cue
+
+    def add_eos_cue_checked(self, new_cue: EOSCue, parent_cue_id: Optional[str] = None):
+        """Validating insert for external callers; raises if the parent list is missing."""
         if parent_cue_id:
             parent_cue_list = self.eos_cues.get(parent_cue_id)
             if parent_cue_list:
-                parent_cue_list.cue_dict[new_cue.uid] = new_cue
+                parent_cue_list.cue_list_dict[new_cue.uid] = new_cue
                 if new_cue.parent_cue_list != parent_cue_list:
                     new_cue.parent_cue_list = parent_cue_list
             else:
                 raise ValueError(f"Parent EOSCueList with ID {parent_cue_id} not found.")
         self.eos_cues[new_cue.uid] = new_cue
 
-    async def remove_eos_cue(self, cue_id: str):
+    def remove_eos_cue(self, cue_id: str):
         cue = self.eos_cues.pop(cue_id, None)
         if cue:
             if cue.parent_cue_list:
-                del cue.parent_cue_list.cue_dict[cue_id]
-            cue.parent_cue = None
+                del cue.parent_cue_list.cue_list_dict[cue_id]
+            cue.parent_cue_list = None
         else:
             raise ValueError(f"EOSCue with ID {cue_id} not found.")
 
@@ -394,13 +697,19 @@ class CueManager:
                     response=f'/eos/out/get/cue/{cue_list_number}/count'
                 )
             cue_count_in_cue_list = int(response[0])
-            for cue in range(cue_count_in_cue_list):
-                address, response = await self.query(
-                    client=self.osc_handler.eos_client,
-                    dispatcher=self.osc_handler.eos_dispatcher,
-                    query=f'/eos/get/cue/{cue_list_number}/index/{cue}',
-                    response='/eos/out/get/cue/*/*/*/list/*/*'
-                )
+            # The index queries are independent, so put them all in flight
+            # at once and parse the replies in a pure-python post-pass;
+            # each reply's own address identifies the cue it describes.
+            results = await self.query_many(
+                client=self.osc_handler.eos_client,
+                dispatcher=self.osc_handler.eos_dispatcher,
+                queries=[f'/eos/get/cue/{cue_list_number}/index/{i}'
+                         for i in range(cue_count_in_cue_list)],
+                response='/eos/out/get/cue/*/*/*/list/*/*'
+            )
+            if results is None:
+                continue
+            for address, response in results:
                 components = address.split('/')
                 cue_number, part_number = int(components[6]), int(components[7])
                 if part_number != 0:
@@ -412,17 +721,51 @@ class CueManager:
                 cue_list_obj.cue_list_dict[cue_object.uid] = cue_object
 
     async def query(
-            self, client, dispatcher, query, response, *args: Optional[Tuple[Any, ...]]) -> Optional[List[Any, ...]]:
+            self, client, dispatcher, query, response, *args: Optional[Tuple[Any, ...]],
+            json_reply: bool = False) -> Optional[List[Any]]:
         try:
-            return await self.osc_handler.query_and_wait(
-                client=client,
-                dispatcher=dispatcher,
-                query_address=query,
-                response_address=response,
-                args=args
-            )
+            async with self._query_semaphore:
+                return await self.osc_handler.query_and_wait(
+                    client,
+                    dispatcher,
+                    query,
+                    response,
+                    *args,
+                    json_reply=json_reply
+                )
         except asyncio.TimeoutError:
             print("Query timed out.")
         except Exception as e:
             print(f"Error occurred: {e}")
             return None
+
+    async def query_many(self, client, dispatcher, queries, response) -> Optional[List[Any]]:
+        try:
+            async with self._query_semaphore:
+                return await self.osc_handler.query_many(
+                    client=client,
+                    dispatcher=dispatcher,
+                    queries=queries,
+                    response_address=response
+                )
+        except asyncio.TimeoutError:
+            print("Multiplexed query timed out.")
+        except Exception as e:
+            print(f"Error occurred: {e}")
+            return None
+
+    async def query_bundle(self, client, dispatcher, pairs,
+                           json_reply: bool = False) -> Optional[List[Any]]:
+        try:
+            async with self._query_semaphore:
+                return await self.osc_handler.query_bundle(
+                    client=client,
+                    dispatcher=dispatcher,
+                    pairs=pairs,
+                    json_reply=json_reply
+                )
+        except asyncio.TimeoutError:
+            print("Bundled query timed out.")
+        except Exception as e:
+            print(f"Error occurred: {e}")
+            return None
@@ -18,6 +18,13 @@ background_pen = QPen(QColor(BACKGROUND))
 accent_pen = QPen(QColor(ACCENT))
 half_accent_pen = QPen(QColor(HALF_ACCENT))
 
+# Fixed-width accent pens shared by every graphics item, so selection
+# state is a pen swap rather than a per-instance copy or setWidth call.
+accent_pen_1 = QPen(QColor(ACCENT))
+accent_pen_1.setWidth(1)
+accent_pen_2 = QPen(QColor(ACCENT))
+accent_pen_2.setWidth(2)
+
 green_pen = QPen(QColor(GREEN))
 blue_pen = QPen(QColor(BLUE))
 orange_pen = QPen(QColor(ORANGE))
\ No newline at end of file
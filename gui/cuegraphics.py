@@ -3,7 +3,8 @@ from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QGraphicsItem
 
 from config.settings import DEFAULT_FONT
-from gui.brushpen import accent_pen, background_brush, half_accent_brush, foreground_pen, background_pen, accent_brush
+from gui.brushpen import accent_pen_1, accent_pen_2, background_brush, half_accent_brush, foreground_pen, \
+    background_pen, accent_brush
 
 
 class BaseCueGraphic(QGraphicsItem):
@@ -12,6 +13,9 @@ class BaseCueGraphic(QGraphicsItem):
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
         self.setAcceptHoverEvents(True)
+        # Let Qt blit a cached pixmap of the item while it is dragged;
+        # paint only reruns when the item itself changes and calls update().
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         self.text = 'Hello, world!'
         self.title_font = QFont(DEFAULT_FONT, 12)
@@ -19,77 +23,106 @@ class BaseCueGraphic(QGraphicsItem):
         self.width, self.height = 200, 100
         self.resizable = True
 
-        self.outline_pen = accent_pen
+        # The two selection-state pens are shared module-level constants;
+        # switching is a rebind, never a QPen property write.
+        self.outline_pen = accent_pen_1
 
         self.rect = QRectF(0, 0, self.width, self.height)  # Initial size
         self.handleSize = 4.0  # Size of the resize handle
         self.resizing = False
         self.handle_hover = False
 
+        self._rebuild_rects()
+
+    def _rebuild_rects(self):
+        """Recompute the cached geometry rects.
+
+        paint/boundingRect are called constantly (every hover, drag and
+        scene update), so the QRectF instances are built once here and
+        only rebuilt when the item's rect actually changes.
+        """
+        self._bounding_rect = self.rect.adjusted(
+            -self.handleSize, -self.handleSize, self.handleSize, self.handleSize)
+        # Width/height, not right/bottom: passing rect.bottom() as the
+        # height made the hit-rect span far past the item, so hovers
+        # nowhere near the handle still registered.
+        self._handle_bound = QRectF(self.rect.right() - self.handleSize / 2,
+                                    self.rect.top() - self.handleSize / 2,
+                                    self.handleSize, self.rect.height() + self.handleSize)
+        self._handle_rect = QRectF(self.rect.right() - self.handleSize / 2,
+                                   self.rect.top() - 1,
+                                   self.handleSize, self.rect.bottom() + 2)
+        self._title_bar_rect = QRectF(self.rect.left(), self.rect.top(),
+                                      self.rect.width(), 16)
+        self._title_text_rect = QRectF(self._title_bar_rect.left() + 2, self._title_bar_rect.top(),
+                                       self._title_bar_rect.width(), self._title_bar_rect.height())
+
     def boundingRect(self):
-        return self.rect.adjusted(-self.handleSize, -self.handleSize, self.handleSize, self.handleSize)
+        return self._bounding_rect
 
     def adjustForZoom(self, zoom_change):
         self.rect.setWidth(self.rect.width() * zoom_change)
+        self._rebuild_rects()
         self.update()  # Redraw the item
 
+    def itemChange(self, change, value):
+        # Swap the outline pen on selection transitions rather than
+        # re-deciding it on every paint.
+        if change == QGraphicsItem.GraphicsItemChange.ItemSelectedHasChanged:
+            self.outline_pen = accent_pen_2 if value else accent_pen_1
+        return super().itemChange(change, value)
+
     def paint(self, painter, option, widget=None):
-        if self.isSelected():
-            self.outline_pen.setWidth(2)
-        else:
-            self.outline_pen.setWidth(1)
         painter.setPen(self.outline_pen)
         painter.setBrush(background_brush)
         painter.drawRect(self.rect)
 
         painter.setBrush(half_accent_brush)
-        painter.drawRect(self.titleBarRect())
+        painter.drawRect(self._title_bar_rect)
         painter.setFont(self.title_font)
         painter.setPen(foreground_pen)
-        painter.drawText(self.titleTextBound(), self.text)
+        painter.drawText(self._title_text_rect, self.text)
 
         # Draw a resize handle
         if self.handle_hover:
             painter.setPen(background_pen)
             painter.setBrush(accent_brush)
-            painter.drawRect(self.resizeHandleRect())
+            painter.drawRect(self._handle_rect)
 
     def resizeHandleBound(self):
-        return QRectF(self.rect.right() - self.handleSize / 2,
-                      self.rect.top() - self.handleSize / 2,
-                      self.handleSize, self.rect.bottom() + self.handleSize)
+        return self._handle_bound
 
     def resizeHandleRect(self):
-        return QRectF(self.rect.right() - self.handleSize / 2,
-                      self.rect.top() - 1,
-                      self.handleSize, self.rect.bottom() + 2)
+        return self._handle_rect
 
     def titleBarRect(self):
-        return QRectF(self.rect.left(), self.rect.top(),
-                      self.rect.width(), 16)
+        return self._title_bar_rect
 
     def titleTextBound(self):
-        return QRectF(self.titleBarRect().left() + 2, self.titleBarRect().top(),
-                      self.titleBarRect().width(), self.titleBarRect().height())
+        return self._title_text_rect
+
+    def _on_handle(self, pos):
+        """Scalar hit test for the resize handle; no QRectF calls per event."""
+        half = self.handleSize / 2
+        return (abs(pos.x() - self.rect.right()) <= half
+                and self.rect.top() - half <= pos.y() <= self.rect.bottom() + half)
 
     def mousePressEvent(self, event):
-        if event.pos() in self.resizeHandleBound() and self.resizable:
-            self.resizing = True
-        else:
-            self.resizing = False
+        self.resizing = self.resizable and self._on_handle(event.pos())
         super().mousePressEvent(event)
 
     def hoverMoveEvent(self, event):
-        if self.resizeHandleBound().contains(event.pos()):
-            self.handle_hover = True
-            self.update()  # Update the item to repaint with the handle
-        else:
-            self.handle_hover = False
+        # Hover moves arrive at mouse-event rate; only repaint when the
+        # handle highlight actually flips on or off.
+        new_hover = self._on_handle(event.pos())
+        if new_hover != self.handle_hover:
+            self.handle_hover = new_hover
             self.update()
 
     def hoverLeaveEvent(self, event):
-        self.handle_hover = False
-        self.update()
+        if self.handle_hover:
+            self.handle_hover = False
+            self.update()
 
     def mouseMoveEvent(self, event):
         if self.resizing and self.resizable:
@@ -105,6 +138,7 @@ class BaseCueGraphic(QGraphicsItem):
         minimum_width = 100
         self.width = minimum_width if not newPos.x() - self.rect.left() >= minimum_width else newPos.x() - self.rect.left()
         self.rect.setSize(QSizeF(self.width, self.height))
+        self._rebuild_rects()
         self.update()
 
 
@@ -1,6 +1,6 @@
 from PyQt6.QtCore import QRectF, QPointF, Qt
-from PyQt6.QtGui import QPainter, QWheelEvent
-from PyQt6.QtWidgets import QGraphicsScene, QGraphicsView, QMainWindow, QGraphicsRectItem, QApplication
+from PyQt6.QtGui import QWheelEvent
+from PyQt6.QtWidgets import QGraphicsScene, QGraphicsView, QMainWindow, QGraphicsRectItem
 
 from gui.brushpen import accent_pen, background_brush, half_accent_pen, foreground_pen
 from gui.cuegraphics import BaseCueGraphic
@@ -11,6 +11,11 @@ from config.settings import TIMECODE_FPS
 from utils import timecode_to_position, position_to_timecode, timecode_to_float
 
 
+# Hoisted out of wheelEvent: enum attribute lookups are not free in PyQt
+# and wheel ticks arrive in bursts.
+_CONTROL_MODIFIER = Qt.KeyboardModifier.ControlModifier
+
+
 class TimelineScene(QGraphicsScene):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -19,7 +24,13 @@ class TimelineScene(QGraphicsScene):
 class TimelineView(QGraphicsView):
     def __init__(self, scene, parent=None):
         super().__init__(scene, parent)
-        self.setRenderHints(QPainter.RenderHint.Antialiasing)
+        # With thousands of small cue/ruler items, computing minimal dirty
+        # regions costs more than repainting the viewport outright.
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        # No antialiasing render hint: everything drawn is axis-aligned
+        # rects and lines, and AA nearly doubles their raster cost.
         self.ruler_graphic = RulerGraphic(self)
         self.scene().addItem(self.ruler_graphic)
         self.base_cue_graphic = BaseCueGraphic()
@@ -30,8 +41,9 @@ class TimelineView(QGraphicsView):
         self.ruler_graphic.updateVisibleMarks()
 
     def wheelEvent(self, event):
-        modifiers = QApplication.keyboardModifiers()
-        if modifiers == Qt.KeyboardModifier.ControlModifier:
+        # The event already carries its modifier state; no need for the
+        # QApplication global-state round-trip.
+        if event.modifiers() == _CONTROL_MODIFIER:
             factor = 1.1 if event.angleDelta().y() > 0 else 0.9
             self.ruler_graphic.scaleZoomFactor(factor)
             self.adjustScrollBars(self.ruler_graphic.zoom_factor)
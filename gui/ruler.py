@@ -1,13 +1,61 @@
 from dataclasses import dataclass
 
-from PyQt6.QtCore import QRectF, QPointF
-from PyQt6.QtGui import QFont
+import numpy as np
+from PyQt6.QtCore import QRectF, QPointF, Qt
+from PyQt6.QtGui import QFont, QFontMetrics, QPainter, QPainterPath, QPixmap
 from PyQt6.QtWidgets import QGraphicsItem, QGraphicsRectItem
 
 from config.settings import DEFAULT_FONT
-from gui.brushpen import accent_pen, background_brush, half_accent_brush, foreground_pen, background_pen, accent_brush, \
-    orange_brush, half_accent_pen
-from utils import float_to_timecode
+from gui.brushpen import accent_pen, accent_pen_1, background_brush, half_accent_brush, foreground_pen, \
+    background_pen, accent_brush, orange_brush, half_accent_pen
+from utils import float_to_timecode_array
+
+
+def _plan_marks_arrays(frames, frame_stride, second_stride, ruler_height):
+    """Compute (indices, heights, kinds) for the marks worth drawing.
+
+    kinds: 0 = on-second mark, 1 = minute/hour mark, 2 = frame mark.
+    Kept free of Qt and Python objects so numba can compile it; the
+    pure-Python body is used unchanged when numba is not installed.
+    """
+    n = frames.shape[0]
+    indices = np.empty(n, dtype=np.int64)
+    heights = np.empty(n, dtype=np.int64)
+    kinds = np.empty(n, dtype=np.int64)
+    count = 0
+    if n == 0:
+        return indices[:0], heights[:0], kinds[:0]
+    base = frames[0]
+
+    step = 30 * second_stride
+    for index in range((-base) % step, n, step):
+        mark = frames[index]
+        indices[count] = index
+        if mark % (30 * 60) == 0:
+            heights[count] = ruler_height - 20
+            kinds[count] = 1
+        else:
+            heights[count] = ruler_height - 40
+            kinds[count] = 0
+        count += 1
+
+    if frame_stride:
+        for index in range((-base) % frame_stride, n, frame_stride):
+            if frames[index] % 30 == 0:
+                continue
+            indices[count] = index
+            heights[count] = ruler_height // 5
+            kinds[count] = 2
+            count += 1
+
+    return indices[:count], heights[:count], kinds[:count]
+
+
+try:
+    from numba import njit
+    _plan_marks_arrays = njit(cache=True)(_plan_marks_arrays)
+except ImportError:
+    pass
 
 
 class RulerBackground(QGraphicsItem):
@@ -27,6 +75,11 @@ class RulerBackground(QGraphicsItem):
 class RulerGraphic(QGraphicsItem):
     def __init__(self, viewport):
         super().__init__()
+        # The owning view is already handed in; holding it (and its
+        # viewport widget) avoids the scene().views()[0] hop on every
+        # scroll in get_visible_range.
+        self._view = viewport
+        self._viewport = viewport.viewport()
         self.zoom_factor = 0.1
         self.init_length = 90000
         self.length = int(self.init_length * self.zoom_factor)
@@ -35,20 +88,53 @@ class RulerGraphic(QGraphicsItem):
         self.background_height = self.height - self.ruler_height
         self.setPos(0, 0)
         self.mark_font = QFont(DEFAULT_FONT, 10)
+        self._plan = self._zoom_plan()
 
-        self.outline_pen = accent_pen
-        self.outline_pen.setWidth(1)
+        self.outline_pen = accent_pen_1
 
-        self.all_marks = self.generate_marks()
-        self.visible_marks = {}
+        # Marks as parallel arrays (SoA): frame numbers and their unscaled
+        # x positions. Visibility becomes two binary searches per scroll
+        # instead of a Python filter over all 108 000 entries.
+        total_frames = 30 * 3600
+        self.frames = np.arange(total_frames, dtype=np.int32)
+        self.positions = self.frames.astype(np.float32) * (self.init_length / total_frames)
+        # Scaled once per zoom change; every scroll then slices views out
+        # of this array instead of re-multiplying the visible range.
+        self._scaled_positions = self.positions * self.zoom_factor
+        self.visible_frames = self.frames[:0]
+        self.visible_positions = self._scaled_positions[:0]
 
-    def get_visible_range(self):
-        # Assuming self.scene() returns the QGraphicsScene this item belongs to
-        # and self.scene().views() returns the list of QGraphicsView viewing the scene
-        view = self.scene().views()[0]  # Assuming there's only one view
+        # Rasterized tick/label band. The full ruler at high zoom is far
+        # wider than a QPixmap allows, so the cache covers three
+        # viewport-widths centred on the view; scrolling inside that span
+        # is a single drawPixmap, scrolling beyond it re-renders.
+        self._ruler_cache = None
+        self._cache_start = 0.0
+        self._cache_end = 0.0
 
+        # Labels only ever contain digits and ':'. Rendering each glyph
+        # once and compositing labels from the pixmaps keeps Qt text
+        # shaping out of the tick render loop entirely.
+        metrics = QFontMetrics(self.mark_font)
+        # Layout advance only; each pixmap is sized from the glyph's real
+        # advance so wider digits are never clipped.
+        self._glyph_width = 7
+        self._glyph_ascent = metrics.ascent()
+        self._glyph_atlas = {}
+        for char in '0123456789:':
+            glyph = QPixmap(max(metrics.horizontalAdvance(char), self._glyph_width),
+                            metrics.height())
+            glyph.fill(Qt.GlobalColor.transparent)
+            glyph_painter = QPainter(glyph)
+            glyph_painter.setFont(self.mark_font)
+            glyph_painter.setPen(foreground_pen)
+            glyph_painter.drawText(QPointF(0, metrics.ascent()), char)
+            glyph_painter.end()
+            self._glyph_atlas[char] = glyph
+
+    def get_visible_range(self):
         # Getting the visible part of the scene in the view
-        visible_rect = view.mapToScene(view.viewport().geometry()).boundingRect()
+        visible_rect = self._view.mapToScene(self._viewport.geometry()).boundingRect()
 
         # Start and end x-coordinates of the visible area
         visible_start = visible_rect.left() / self.zoom_factor
@@ -56,26 +142,15 @@ class RulerGraphic(QGraphicsItem):
 
         return visible_start, visible_end
 
-    def generate_marks(self):
-        total_frames = 30 * 3600
-        marks = {}
-        for frame in range(total_frames):
-            x_position = self.calculate_position(frame)
-            marks[frame] = x_position
-        return marks
-
-    def calculate_position(self, frame_number):
-        # Calculate the x-coordinate for a given frame number
-        position = (frame_number / (30 * 3600)) * self.init_length
-        return position
-
     def updateVisibleMarks(self):
-        self.visible_marks = self.calculateVisibleMarks()
+        self.visible_frames, self.visible_positions = self.calculateVisibleMarks()
         self.update()
 
     def calculateVisibleMarks(self):
         visible_start, visible_end = self.get_visible_range()
-        return {mark: pos * self.zoom_factor for mark, pos in self.all_marks.items() if visible_start - 10 <= pos <= visible_end + 10}
+        lo = np.searchsorted(self.positions, visible_start - 10, side='left')
+        hi = np.searchsorted(self.positions, visible_end + 10, side='right')
+        return self.frames[lo:hi], self._scaled_positions[lo:hi]
 
     def boundingRect(self):
         return QRectF(0, 0, self.length, self.background_height + self.ruler_height)
@@ -91,52 +166,121 @@ class RulerGraphic(QGraphicsItem):
         self.zoom_factor = max(0.1, min(30.0, new_zoom_factor))
         self.length = int(self.init_length * self.zoom_factor)
         print(self.zoom_factor, self.length)
+        self._plan = self._zoom_plan()
+        self._scaled_positions = self.positions * self.zoom_factor
+        self._ruler_cache = None
         self.updateVisibleMarks()
         self.update()
 
+    def _zoom_plan(self):
+        """Tick strides for the current zoom level.
+
+        Returns (frame_stride, second_stride, label_seconds). A frame
+        stride of 0 disables frame ticks. Computed once per zoom change
+        so mark planning is plain strided iteration instead of a modulo
+        ladder evaluated per visible mark.
+        """
+        zoom = self.zoom_factor
+        if zoom <= 8.0:
+            frame_stride = 0
+        elif zoom < 12.0:
+            frame_stride = 5
+        elif zoom < 16.0:
+            frame_stride = 3
+        elif zoom < 20.0:
+            frame_stride = 2
+        else:
+            frame_stride = 1
+        if zoom < 0.2:
+            second_stride = 15
+        elif zoom < 1.0:
+            second_stride = 5
+        else:
+            second_stride = 1
+        return frame_stride, second_stride, zoom < 4.0
+
+    def _plan_marks(self, frames, positions):
+        """Yield (index, mark, pos, tick_height, frame, second) for marks to draw."""
+        frame_stride, second_stride, label_seconds = self._plan
+        indices, heights, kinds = _plan_marks_arrays(
+            frames, frame_stride, second_stride, self.ruler_height)
+        for i in range(len(indices)):
+            index = int(indices[i])
+            kind = int(kinds[i])
+            yield (index, int(frames[index]), positions[index], int(heights[i]),
+                   kind == 2, kind == 0 and label_seconds)
+
+    def _render_ruler_cache(self):
+        """Rasterize the tick/label band around the current visible range."""
+        visible_start, visible_end = self.get_visible_range()
+        margin = visible_end - visible_start
+        lo_unscaled = max(0.0, visible_start - margin)
+        hi_unscaled = visible_end + margin
+        start = lo_unscaled * self.zoom_factor
+        end = min(float(self.length), hi_unscaled * self.zoom_factor)
+
+        lo = np.searchsorted(self.positions, lo_unscaled, side='left')
+        hi = np.searchsorted(self.positions, hi_unscaled, side='right')
+        frames = self.frames[lo:hi]
+        positions = self._scaled_positions[lo:hi]
+
+        pixmap = QPixmap(max(1, int(end - start) + 1), self.ruler_height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        # All full-timecode labels for the slice in one vectorized pass.
+        timecode_labels = float_to_timecode_array(frames / 30.0)
+
+        pixmap_painter = QPainter(pixmap)
+        pixmap_painter.translate(-start, 0)
+        # All tick strokes share one pen, so they go into a single path
+        # drawn with one drawPath call instead of a drawLine per mark.
+        tick_path = QPainterPath()
+        for index, mark, pos, height, frame, second in self._plan_marks(frames, positions):
+            x = int(pos)
+            tick_path.moveTo(x, self.ruler_height - height + 2)
+            tick_path.lineTo(x, self.ruler_height)
+            self._draw_label(pixmap_painter, mark, pos,
+                             timecode_labels[index], frame, second)
+        pixmap_painter.setPen(accent_pen)
+        pixmap_painter.drawPath(tick_path)
+        pixmap_painter.end()
+
+        self._ruler_cache = pixmap
+        self._cache_start = start
+        self._cache_end = end
+
     def paint(self, painter, option, widget=None):
         painter.setPen(self.outline_pen)
         painter.setBrush(background_brush)
         painter.drawRect(self.boundingRect())
         painter.drawRect(self.rulerRect())
 
-        frame_threshold = self.zoom_factor > 8.0
-
-        for mark, pos in self.visible_marks.items():
-            height = self.ruler_height // 5
-            frame = True
-            second = False
-            if mark % (30 * 60 * 60) == 0:
-                height = self.ruler_height - 20
-                frame = False
-            elif mark % (30 * 60) == 0:
-                height = self.ruler_height - 20
-                frame = False
-            elif mark % 30 == 0:
-                frame = False
-                number = mark / 30
-                if self.zoom_factor < 0.2 and not number % 15 == 0:
-                    continue
-                if 0.2 <= self.zoom_factor < 1.0 and not number % 5 == 0:
-                    continue
-                if self.zoom_factor < 4.0:
-                    second = True
-                height = self.ruler_height - 40
-
-            elif frame_threshold:
-                if self.zoom_factor < 12.0 and 0 < (mark % 30) % 5 <= 5:
-                    continue
-                if 12.0 <= self.zoom_factor < 16.0 and not (mark % 30) % 3 == 0:
-                    continue
-                if 16.0 <= self.zoom_factor < 20.0 and (mark % 30) % 2 == 1:
-                    continue
-            else:
-                continue
-            self.draw_mark(painter, mark, pos, height, frame, second)
+        visible_start, visible_end = self.get_visible_range()
+        want_start = max(0.0, visible_start * self.zoom_factor)
+        want_end = min(float(self.length), visible_end * self.zoom_factor)
+        if (self._ruler_cache is None
+                or want_start < self._cache_start
+                or want_end > self._cache_end):
+            self._render_ruler_cache()
+        painter.drawPixmap(int(self._cache_start), 0, self._ruler_cache)
 
-    def draw_mark(self, painter, mark, mark_pos, height, frame=False, second=False):
+        # Full-height gridlines stay live: they are cheap lines, and
+        # caching them would force the band to cover the whole viewport.
+        # One path per pen class keeps this at two drawPath calls.
+        accent_path = QPainterPath()
+        half_accent_path = QPainterPath()
+        for index, mark, pos, height, frame, second in self._plan_marks(
+                self.visible_frames, self.visible_positions):
+            x = int(pos)
+            path = accent_path if mark % 30 == 0 else half_accent_path
+            path.moveTo(x, self.ruler_height)
+            path.lineTo(x, self.height)
+        painter.setPen(half_accent_pen)
+        painter.drawPath(half_accent_path)
         painter.setPen(accent_pen)
-        text = float_to_timecode(mark / 30)
+        painter.drawPath(accent_path)
+
+    def _draw_label(self, painter, mark, mark_pos, timecode_label, frame=False, second=False):
+        text = timecode_label
         text_y = 14
         if frame:
             text = str(mark % 30)
@@ -145,15 +289,11 @@ class RulerGraphic(QGraphicsItem):
             text = str(int((mark / 30) % 60))
         if mark % 30 == 0 and not mark % (30 * 60) == 0:
             text_y = 30
-        number_pos = mark_pos - (len(text) * 7) / 2
-        painter.drawLine(int(mark_pos), self.ruler_height - height + 2, int(mark_pos), self.ruler_height)
-        if frame or second:
-            painter.setPen(half_accent_pen)
-        if mark % 30 == 0:
-            painter.setPen(accent_pen)
-        painter.drawLine(int(mark_pos), self.ruler_height, int(mark_pos), self.height)
-        painter.setPen(foreground_pen)
-        painter.drawText(QPointF(int(number_pos), text_y), text)
+        x = int(mark_pos - (len(text) * 7) / 2)
+        y = text_y - self._glyph_ascent
+        for char in text:
+            painter.drawPixmap(x, y, self._glyph_atlas[char])
+            x += self._glyph_width
 
 
 class BackgroundGrid(QGraphicsRectItem):
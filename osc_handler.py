@@ -2,6 +2,7 @@
 
 import asyncio
 from asyncio import Task
+from collections import deque
 from typing import Tuple, Optional, Any
 
 from pythonosctcp import Dispatcher, AsyncTCPClient
@@ -10,6 +11,20 @@ from utils import parse_json
 from config.settings import QLAB_ADDRESS, EOS_ADDRESS
 
 
+# Replies larger than this are parsed off the event loop; a multi-MB
+# /cueLists payload otherwise blocks every other in-flight query while
+# the dict is constructed.
+_OFFLOAD_PARSE_THRESHOLD = 64 * 1024
+
+
+async def _parse_reply_json(response_args):
+    """Decode the JSON payload of an OSC reply (a single string argument)."""
+    payload = response_args[0] if len(response_args) == 1 else response_args
+    if isinstance(payload, (str, bytes)) and len(payload) > _OFFLOAD_PARSE_THRESHOLD:
+        return await asyncio.get_event_loop().run_in_executor(None, parse_json, payload)
+    return parse_json(payload)
+
+
 class OSCHandler:
     def __init__(self, loop, gui):
         self.loop = loop
@@ -18,6 +33,7 @@ class OSCHandler:
         self.qlab_client = AsyncTCPClient(server_address=QLAB_ADDRESS, dispatcher=self.qlab_dispatcher)
         self.qlab_connected = False
         self.qlab_show_name = ''
+        self.qlab_workspace_uid = ''
 
         self.eos_dispatcher = Dispatcher()
         self.eos_client = AsyncTCPClient(server_address=EOS_ADDRESS, dispatcher=self.eos_dispatcher)
@@ -26,14 +42,60 @@ class OSCHandler:
 
         self.gui = gui
 
+        # One event per response address, set while its handler slot is
+        # free. Waiters block on the event instead of sleep-polling the
+        # dispatcher's handler table.
+        self._slot_free = {}
+
+    def _slot_event(self, response_address):
+        event = self._slot_free.get(response_address)
+        if event is None:
+            event = asyncio.Event()
+            event.set()
+            self._slot_free[response_address] = event
+        return event
+
+    async def _wait_for_slot(self, dispatcher, response_address, timeout):
+        """Wait until no handler is mapped to response_address, then claim it."""
+        event = self._slot_event(response_address)
+        deadline = asyncio.get_event_loop().time() + timeout
+        # A release wakes every waiter, so each one must re-check the
+        # handler table: only the first to run claims the slot, the rest
+        # clear the event and go back to waiting.
+        while dispatcher.handlers.get(response_address):
+            event.clear()
+            remaining = deadline - asyncio.get_event_loop().time()
+            try:
+                await asyncio.wait_for(event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                raise TimeoutError("Timeout waiting for handler to be free.")
+        event.clear()
+
+    def _release_slot(self, dispatcher, response_address):
+        """Unmap response_address and wake any waiter for the slot."""
+        if dispatcher.handlers.get(response_address):
+            dispatcher.unmap(response_address)
+        event = self._slot_free.get(response_address)
+        if event is not None:
+            event.set()
+
     async def run(self):
         init_client_task = asyncio.create_task(self.init_client())
         await init_client_task
 
     async def init_client(self):
         try:
-            qlab_client_task = await start_client(self.qlab_client, self.gui, QLAB_ADDRESS)
-            eos_client_task = await start_client(self.eos_client, self.gui, EOS_ADDRESS)
+            # Start both clients together: each probe waits on the
+            # connection, and running them serially doubles launch time.
+            qlab_client_task, eos_client_task = await asyncio.gather(
+                start_client(self.qlab_client, self.gui, QLAB_ADDRESS),
+                start_client(self.eos_client, self.gui, EOS_ADDRESS),
+                return_exceptions=True,
+            )
+            if isinstance(qlab_client_task, BaseException):
+                raise qlab_client_task
+            if isinstance(eos_client_task, BaseException):
+                raise eos_client_task
             self.qlab_connected = await self.connect_to_qlab()
             if not self.qlab_connected:
                 raise ConnectionError("Failed to connect to QLab!")
@@ -49,15 +111,8 @@ class OSCHandler:
     async def query_and_wait(self,
             client: AsyncTCPClient, dispatcher: Dispatcher,
             query_address: str, response_address: str, *args: Tuple[Any, ...],
-            check_interval=0.1, timeout=5.0):
-        # Define the start time for the timeout
-        start_time = asyncio.get_event_loop().time()
-
-        # Wait until no handler is mapped to the response_address
-        while dispatcher.handlers.get(response_address):
-            await asyncio.sleep(check_interval)
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                raise TimeoutError("Timeout waiting for handler to be free.")
+            timeout=5.0, json_reply=False):
+        await self._wait_for_slot(dispatcher, response_address, timeout)
 
         response_future = asyncio.Future()
 
@@ -74,8 +129,12 @@ class OSCHandler:
 
         try:
             # Wait for the response
-            response = await response_future
-            return response
+            address, response_args = await response_future
+            if json_reply:
+                # Decode the JSON payload once here so call sites get a
+                # ready dict instead of each re-parsing the same string.
+                return address, await _parse_reply_json(response_args)
+            return address, response_args
         except asyncio.CancelledError:
             # Handle cancellation of the query
             raise
@@ -85,29 +144,108 @@ class OSCHandler:
                 response_future.set_exception(e)
             raise
         finally:
-            # Clean up by unmapping the handler
-            if dispatcher.handlers.get(response_address):
-                dispatcher.unmap(response_address)
+            # Clean up by unmapping the handler and waking any waiter
+            self._release_slot(dispatcher, response_address)
+
+    async def query_bundle(self,
+            client: AsyncTCPClient, dispatcher: Dispatcher,
+            pairs, timeout=5.0, json_reply=False):
+        """Send a batch of queries together and await all of their replies.
+
+        pythonosctcp does not expose OSC #bundle framing, so the batch is
+        written back-to-back on the TCP stream instead — the replies still
+        come back concurrently, collapsing N serial round-trips into one.
+        All response handlers are registered before the first query is sent
+        so no reply can race past its handler.
+
+        :param pairs: Sequence of (query_address, response_address) tuples.
+        :return: List of (address, response_args) in the order of pairs.
+        """
+        futures = []
+        mapped = []
+        try:
+            for _, response_address in pairs:
+                future = asyncio.Future()
+
+                def make_handler(fut):
+                    async def response_handler(address, *response_args):
+                        if not fut.done():
+                            fut.set_result((address, response_args))
+                    return response_handler
+
+                dispatcher.map(response_address, make_handler(future))
+                mapped.append(response_address)
+                futures.append(future)
+
+            for query_address, _ in pairs:
+                await client.add_message(query_address)
+
+            results = await asyncio.wait_for(asyncio.gather(*futures), timeout=timeout)
+            if json_reply:
+                return [(address, await _parse_reply_json(response_args))
+                        for address, response_args in results]
+            return results
+        finally:
+            for response_address in mapped:
+                if dispatcher.handlers.get(response_address):
+                    dispatcher.unmap(response_address)
+
+    async def query_many(self,
+            client: AsyncTCPClient, dispatcher: Dispatcher,
+            queries, response_address: str,
+            timeout=5.0):
+        """Issue many queries that share a single (wildcard) response address.
+
+        One handler is mapped for the response address and each incoming
+        reply resolves the next pending future in FIFO order, so the
+        queries can all be in flight at once. Every result carries its own
+        reply address, letting callers match replies by content when the
+        server answers out of order.
+
+        :param queries: Sequence of query addresses to send.
+        :param response_address: The shared response address pattern.
+        :return: List of (address, response_args), one per query.
+        """
+        await self._wait_for_slot(dispatcher, response_address, timeout)
+
+        futures = [asyncio.Future() for _ in queries]
+        pending = deque(futures)
+
+        async def response_handler(address, *response_args):
+            while pending:
+                future = pending.popleft()
+                if not future.done():
+                    future.set_result((address, response_args))
+                    break
+
+        dispatcher.map(response_address, response_handler)
+        try:
+            for query_address in queries:
+                await client.add_message(query_address)
+            return await asyncio.wait_for(asyncio.gather(*futures), timeout=timeout)
+        finally:
+            self._release_slot(dispatcher, response_address)
 
     async def connect_to_qlab(self):
         if self.qlab_connected:
             print("Already connected to QLab.")
             return True
-        address, response_json = await self.query_and_wait(
+        address, response = await self.query_and_wait(
             self.qlab_client, self.qlab_dispatcher,
             query_address="/workspaces", response_address="/reply/workspaces",
+            json_reply=True,
         )
-        response = parse_json(response_json)
         if response is None or response['status'] == 'error':
             raise ConnectionError("Error whilst connecting to QLab.")
         if response['status'] == 'ok':
             workspace_uid = response['data']['uniqueID']
-            address, connect_response_json = await self.query_and_wait(
+            self.qlab_workspace_uid = workspace_uid
+            address, connect_response = await self.query_and_wait(
                 self.qlab_client, self.qlab_dispatcher,
                 query_address=f"/workspace/{workspace_uid}/connect",
                 response_address=f"/reply/workspace/{workspace_uid}/connect",
+                json_reply=True,
             )
-            connect_response = parse_json(connect_response_json)
             if connect_response is None or connect_response['status'] == 'error':
                 raise ConnectionError(f"Error whilst connecting to QLab workspace {workspace_uid}.")
             if response['status'] == 'ok' and response['data'] == 'ok':
@@ -138,8 +276,14 @@ async def start_client(
     try:
         client_task = asyncio.create_task(client.run())
 
-        # Wait for a short period to allow connection to establish
-        await asyncio.sleep(1)
+        # Prefer waiting on the client's connection event, which resolves
+        # as soon as the handshake completes; fall back to the fixed
+        # warm-up sleep when the client does not expose one.
+        connected_event = getattr(client, '_connected_event', None)
+        if connected_event is not None:
+            await asyncio.wait_for(connected_event.wait(), timeout=5.0)
+        else:
+            await asyncio.sleep(1)
 
         if client.is_connected():
             print(f"Client successfully connected to address {server_address}")
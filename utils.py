@@ -1,14 +1,29 @@
-import re
+import functools
 import json
 from typing import Union, Dict, Any, List, Tuple
 
+import numpy as np
+
 from config.settings import TIMECODE_FPS
 
 
+# User-assignable port range accepted for QLab/EOS connections.
+_PORT_MIN, _PORT_MAX = 49152, 65535
+
+
 def validate_ip(ip: str) -> bool:
-    # Regex for validating an IP address
-    ip_regex = re.compile(r'^(?:[0-9]{1,3}\.){3}[0-9]{1,3}$')
-    return ip_regex.match(ip) is not None
+    # Splitting and bounds-checking four octets beats the regex engine
+    # for something this small, and also rejects octets above 255.
+    parts = ip.split('.')
+    return len(parts) == 4 and all(
+        p.isdigit() and len(p) <= 3 and int(p) <= 255 for p in parts)
+
+
+def validate_port(port: str) -> bool:
+    try:
+        return _PORT_MIN <= int(port) <= _PORT_MAX
+    except ValueError:
+        return False
 
 
 def timecode_to_float(timecode: str, fps: int = TIMECODE_FPS) -> float:
@@ -16,6 +31,11 @@ def timecode_to_float(timecode: str, fps: int = TIMECODE_FPS) -> float:
     return hh * 3600 + mm * 60 + ss + ff / fps
 
 
+# Memoized because the GUI formats the same frame-quantized values over and
+# over across redraws; cleared by config.settings.change_fps. The domain is
+# bounded (one entry per distinct mark on a 1-hour timeline), so the cache
+# is sized to hold all of it and hit rates approach 100% during scroll.
+@functools.lru_cache(maxsize=128 * 1024)
 def float_to_timecode(seconds: float, fps: float = TIMECODE_FPS) -> str:
     hh = int(seconds // 3600)
     seconds %= 3600
@@ -27,6 +47,24 @@ def float_to_timecode(seconds: float, fps: float = TIMECODE_FPS) -> str:
     return f"{hh:02}:{mm:02}:{ss:02}:{ff:02}"
 
 
+def float_to_timecode_array(seconds: np.ndarray, fps: float = TIMECODE_FPS) -> np.ndarray:
+    """Batched float_to_timecode: format an array of seconds in one pass.
+
+    The divmod and string assembly all run at C level, so callers with
+    many values (e.g. every visible ruler mark) avoid a Python-level
+    format call per element.
+    """
+    whole = seconds.astype(np.int64)
+    hh, rem = np.divmod(whole, 3600)
+    mm, ss = np.divmod(rem, 60)
+    ff = ((seconds - whole) * fps).astype(np.int64)
+
+    out = np.char.zfill(hh.astype(str), 2)
+    for field in (mm, ss, ff):
+        out = np.char.add(np.char.add(out, ':'), np.char.zfill(field.astype(str), 2))
+    return out
+
+
 PIXEL_TO_SECOND_FACTOR = 60
 
 
@@ -59,9 +97,20 @@ def position_to_timecode(position, zoom_factor, offset=0):
     return timecode
 
 
-def parse_json(json_string: str) -> Union[Dict[str, Any], None]:
-    try:
-        response = json.loads(json_string)
-        return response
-    except json.JSONDecodeError:
-        return None
+# orjson decodes the small QLab reply bodies several times faster than the
+# stdlib; fall back to json when it is not installed. The branch is taken
+# once at import, not per call.
+try:
+    import orjson as _json
+
+    def parse_json(json_string: str) -> Union[Dict[str, Any], None]:
+        try:
+            return _json.loads(json_string)
+        except _json.JSONDecodeError:
+            return None
+except ImportError:
+    def parse_json(json_string: str) -> Union[Dict[str, Any], None]:
+        try:
+            return json.loads(json_string)
+        except json.JSONDecodeError:
+            return None